@@ -20,8 +20,6 @@ License: MIT
 import sys
 import os
 import json
-import base64
-import mimetypes
 import subprocess
 import socket
 import shutil
@@ -29,6 +27,9 @@ import tempfile
 import webbrowser
 import threading
 import re
+import functools
+import logging
+import importlib.util
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -37,9 +38,10 @@ import asyncio
 # FastAPI and related imports
 try:
     from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request
-    from fastapi.responses import JSONResponse, StreamingResponse, FileResponse, HTMLResponse
+    from fastapi.responses import JSONResponse, Response, StreamingResponse, FileResponse, HTMLResponse
     from fastapi.staticfiles import StaticFiles
     from fastapi.middleware.cors import CORSMiddleware
+    from starlette.background import BackgroundTask
     from contextlib import asynccontextmanager
     from pydantic import BaseModel
     import httpx
@@ -60,18 +62,54 @@ except ImportError:
     print("[SDK] OpenCode SDK not available. Using direct API proxy.")
     print("      To enable SDK: pip install opencode-ai")
 
+# Per-event SSE diagnostics go through logging so they cost nothing unless
+# enabled (DEV=1); startup and connection messages stay as prints
+logger = logging.getLogger("web_builder")
+
 # Whisper for voice transcription
-HAS_WHISPER = False
-try:
-    from faster_whisper import WhisperModel
-    import sounddevice as sd
-    import numpy as np
-    import torch
-    HAS_WHISPER = True
-except ImportError:
+# Only check availability here - torch and faster_whisper are slow to import,
+# so WhisperService imports them when the model is first needed.
+HAS_WHISPER = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("faster_whisper", "sounddevice", "numpy", "torch")
+)
+if not HAS_WHISPER:
     print("Warning: Whisper not available. Voice transcription disabled.")
     print("To enable: pip install faster-whisper sounddevice numpy torch")
 
+# Fast JSON (optional - falls back to stdlib json)
+HAS_ORJSON = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    pass
+
+# JSON helpers for the SSE hot loop: str/bytes/memoryview in, UTF-8 bytes out.
+# orjson's functions are bound directly so each frame pays no wrapper call.
+if HAS_ORJSON:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    def _json_loads(data):
+        """Parse JSON from str, bytes or memoryview"""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to UTF-8 encoded JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# Response class for JSON API replies
+if HAS_ORJSON:
+    class _JSONResponse(JSONResponse):
+        """JSONResponse rendered with orjson"""
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+else:
+    _JSONResponse = JSONResponse
+
 
 # =============================================================================
 # Pydantic Models for API
@@ -104,6 +142,32 @@ class CreateSessionRequest(BaseModel):
 # Task Output Parser (for extracting subagent details)
 # =============================================================================
 
+# Patterns used by TaskOutputParser, compiled once at import time
+# Tool names from "Called X" / "Using X tool" and "[X]", fused into one
+# alternation since their matches can never overlap. "Tool: X" keeps its own
+# scan: it overlaps the verb form, e.g. "Running Tool: read".
+_TOOL_COMBINED = re.compile(
+    r'(?:(?:Called|Using|Executed|Running|Invoking)\s+(?P<a>\w+)(?:\s+tool)?'
+    r'|\[(?P<b>\w+)\])',  # [bash], [read], etc.
+    re.IGNORECASE
+)
+_TOOL_LABEL = re.compile(r'Tool:\s*(\w+)', re.IGNORECASE)
+
+_VALID_TOOLS = frozenset({'bash', 'read', 'write', 'edit', 'grep', 'glob', 'task'})
+
+_READ_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:Reading|Read|Opened)\s+[`"\']?([^\s`"\']+\.\w+)[`"\']?',
+    r'File:\s*([^\s]+\.\w+)',
+)]
+
+_WRITE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:Writing|Wrote|Created|Modified|Updated)\s+[`"\']?([^\s`"\']+\.\w+)[`"\']?',
+)]
+
+# Literal markers, matched against the lower-cased output
+_ERROR_MARKERS = ('error', 'failed', 'exception', 'unable to')
+
+
 class TaskOutputParser:
     """Parse task tool output to extract subagent execution details"""
     
@@ -133,48 +197,33 @@ class TaskOutputParser:
         }
         
         # Extract tool names from patterns like "Called X", "Using X tool", "Executed X"
-        tool_patterns = [
-            r'(?:Called|Using|Executed|Running|Invoking)\s+(\w+)(?:\s+tool)?',
-            r'\[(\w+)\]',  # [bash], [read], etc.
-            r'Tool:\s*(\w+)',
-        ]
-        
         tools_found = set()
-        for pattern in tool_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
-            for match in matches:
-                tool_name = match.lower()
-                if tool_name in ['bash', 'read', 'write', 'edit', 'grep', 'glob', 'task']:
-                    tools_found.add(tool_name)
+        for m in _TOOL_COMBINED.finditer(output):
+            tool_name = (m.group('a') or m.group('b')).lower()
+            if tool_name in _VALID_TOOLS:
+                tools_found.add(tool_name)
+        for match in _TOOL_LABEL.findall(output):
+            tool_name = match.lower()
+            if tool_name in _VALID_TOOLS:
+                tools_found.add(tool_name)
         
         result['tools'] = list(tools_found)
         
         # Extract file paths for read operations
-        read_patterns = [
-            r'(?:Reading|Read|Opened)\s+[`"\']?([^\s`"\']+\.\w+)[`"\']?',
-            r'File:\s*([^\s]+\.\w+)',
-        ]
-        for pattern in read_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
-            result['files_read'].extend(matches)
+        for pattern in _READ_PATTERNS:
+            result['files_read'].extend(pattern.findall(output))
         
         # Extract file paths for write operations
-        write_patterns = [
-            r'(?:Writing|Wrote|Created|Modified|Updated)\s+[`"\']?([^\s`"\']+\.\w+)[`"\']?',
-        ]
-        for pattern in write_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
-            result['files_written'].extend(matches)
+        for pattern in _WRITE_PATTERNS:
+            result['files_written'].extend(pattern.findall(output))
         
         # Check for errors
-        error_patterns = [r'error', r'failed', r'exception', r'unable to']
-        for pattern in error_patterns:
-            if re.search(pattern, output, re.IGNORECASE):
-                result['has_errors'] = True
-                break
+        lowered = output.lower()
+        result['has_errors'] = any(marker in lowered for marker in _ERROR_MARKERS)
         
-        # Extract summary (first meaningful paragraph or first 200 chars)
-        lines = output.strip().split('\n')
+        # Extract summary (first meaningful paragraph or first 200 chars).
+        # Only the head of the output is needed, so don't split all of it.
+        lines = output[:2048].strip().split('\n', 5)
         summary_lines = []
         for line in lines[:5]:  # First 5 lines
             line = line.strip()
@@ -185,13 +234,24 @@ class TaskOutputParser:
         
         result['summary'] = ' '.join(summary_lines)[:300]
         
-        # Deduplicate
-        result['files_read'] = list(set(result['files_read']))[:10]
-        result['files_written'] = list(set(result['files_written']))[:10]
+        # Deduplicate (keeping first-seen order)
+        result['files_read'] = list(dict.fromkeys(result['files_read']))[:10]
+        result['files_written'] = list(dict.fromkeys(result['files_written']))[:10]
         
         return result
 
 
+def sse_frame_needs_enhancing(frame: bytes) -> bool:
+    """
+    Cheap check on a raw SSE frame before parsing it.
+    
+    enhance_sse_event only changes message.part.updated events for tool
+    parts, and both strings appear verbatim in such a frame. Anything else
+    can be forwarded untouched, skipping a JSON decode and re-encode.
+    """
+    return b'message.part.updated' in frame and b'"tool"' in frame
+
+
 def enhance_sse_event(event_data: Dict) -> Dict:
     """
     Enhance SSE event data with additional metadata for subagent/task handling.
@@ -204,61 +264,68 @@ def enhance_sse_event(event_data: Dict) -> Dict:
     if not isinstance(event_data, dict):
         return event_data
     
-    event_type = event_data.get('type')
+    # Fast path: most frames are token deltas and other non-tool updates
+    if event_data.get('type') != 'message.part.updated':
+        return event_data
+    
+    part = event_data.get('properties', {}).get('part', {})
+    
+    # Only tool events carry subagent/category metadata
+    if part.get('type') != 'tool':
+        return event_data
+    
+    tool_name = part.get('tool', '')
     
-    # Handle message.part.updated events
-    if event_type == 'message.part.updated':
-        properties = event_data.get('properties', {})
-        part = properties.get('part', {})
-        part_type = part.get('type')
+    # Mark task tool as subagent
+    if tool_name == 'task':
+        state = part.get('state', {})
+        task_input = state.get('input', {})
+        event_data['_is_subagent'] = True
+        event_data['_subagent_type'] = task_input.get('subagent_type', 'general')
+        event_data['_subagent_description'] = task_input.get('description', '')
         
-        # Check if this is a tool event
-        if part_type == 'tool':
-            tool_name = part.get('tool', '')
-            state = part.get('state', {})
-            status = state.get('status', '')
-            
-            # Mark task tool as subagent
-            if tool_name == 'task':
-                event_data['_is_subagent'] = True
-                event_data['_subagent_type'] = state.get('input', {}).get('subagent_type', 'general')
-                event_data['_subagent_description'] = state.get('input', {}).get('description', '')
-                
-                # Parse completed task output
-                if status == 'completed':
-                    output = state.get('output', '')
-                    parsed = TaskOutputParser.parse(output)
-                    event_data['_subagent_parsed'] = parsed
-            
-            # Add tool category metadata
-            event_data['_tool_category'] = get_tool_category(tool_name)
+        # Parse completed task output
+        if state.get('status', '') == 'completed':
+            output = state.get('output', '')
+            parsed = TaskOutputParser.parse(output)
+            event_data['_subagent_parsed'] = parsed
+    
+    # Add tool category metadata
+    event_data['_tool_category'] = get_tool_category(tool_name)
     
     return event_data
 
 
+_TOOL_CATEGORIES = {
+    'bash': 'execution',
+    'read': 'file',
+    'write': 'file',
+    'edit': 'file',
+    'grep': 'search',
+    'glob': 'search',
+    'task': 'subagent',
+}
+
+
 def get_tool_category(tool_name: str) -> str:
     """Categorize tools for UI display"""
-    categories = {
-        'bash': 'execution',
-        'read': 'file',
-        'write': 'file',
-        'edit': 'file',
-        'grep': 'search',
-        'glob': 'search',
-        'task': 'subagent',
-    }
-    return categories.get(tool_name.lower(), 'other')
+    return _TOOL_CATEGORIES.get(tool_name.lower(), 'other')
 
 
 # =============================================================================
 # Configuration
 # =============================================================================
 
+# Last parsed config file: ((st_mtime_ns, st_size), config, serialized body or None)
+_config_cache: Optional[tuple] = None
+
+
 class Config:
     """Application configuration"""
     
     # Directories
-    PROJECTS_DIR: Path = Path.home() / "Desktop" / "game"
+    DEFAULT_PROJECTS_DIR: Path = Path.home() / "Desktop" / "game"
+    PROJECTS_DIR: Path = DEFAULT_PROJECTS_DIR
     DATA_DIR: Path = Path.home() / ".game_launcher"
     CONFIG_FILE: Path = DATA_DIR / "config.json"
     STATIC_DIR: Path = Path(__file__).parent / "static"
@@ -271,15 +338,23 @@ class Config:
     # Whisper (Voice)
     WHISPER_MODEL: str = "base"  # tiny, base, small, medium, large
     WHISPER_DEVICE: str = "auto"  # auto, cpu, cuda
+    WHISPER_COMPUTE_TYPE: str = "auto"  # auto, int8_float16, float16, int8, ...
     WHISPER_LANGUAGE: str = "zh"  # Chinese
     
     # Web Server
     WEB_PORT: int = 8686
     WEB_HOST: str = "0.0.0.0"
     
+    # SSE proxy
+    SSE_BATCH_MAX_BYTES: int = 64 * 1024  # Max bytes coalesced into one write
+    SSE_QUEUE_MAX_FRAMES: int = 1024  # Frames buffered before upstream reads pause
+    
     # CORS
     CORS_ORIGINS: List[str] = ["*"]  # Allow all origins for local development
     
+    # Development: disable all static file caching (DEV=1)
+    DEV_MODE: bool = os.environ.get('DEV') == '1'
+    
     @classmethod
     def ensure_directories(cls):
         """Create necessary directories if they don't exist"""
@@ -292,16 +367,30 @@ class Config:
     @classmethod
     def load_config(cls) -> Dict:
         """Load configuration from file"""
-        if cls.CONFIG_FILE.exists():
+        global _config_cache
+        try:
+            st = cls.CONFIG_FILE.stat()
+        except OSError:
+            st = None
+        
+        if st is not None:
+            # Unchanged file - skip reading and parsing it again
+            cache_key = (st.st_mtime_ns, st.st_size)
+            if _config_cache is not None and _config_cache[0] == cache_key:
+                return _config_cache[1].copy()
+            
             try:
-                with open(cls.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    # Update PROJECTS_DIR if custom path is set
-                    if config.get("projects_root"):
-                        cls.PROJECTS_DIR = Path(config["projects_root"])
-                    return config
+                config = _json_loads(cls.CONFIG_FILE.read_bytes())
+                # Update PROJECTS_DIR if custom path is set
+                if config.get("projects_root"):
+                    cls.PROJECTS_DIR = Path(config["projects_root"])
+                _config_cache = (cache_key, config, None)
+                return config.copy()
             except:
                 pass
+        
+        # Missing or unreadable file - nothing valid to cache
+        _config_cache = None
         return {
             "last_project": "",
             "last_model": "",
@@ -313,55 +402,112 @@ class Config:
     @classmethod
     def save_config(cls, config: Dict):
         """Save configuration to file"""
+        global _config_cache
         cls.ensure_directories()
-        with open(cls.CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        if HAS_ORJSON:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+        cls.CONFIG_FILE.write_bytes(data)
+        
+        # Refresh the cache in place so the next load skips parsing
+        config = dict(config)
+        if config.get("projects_root"):
+            cls.PROJECTS_DIR = Path(config["projects_root"])
+        st = cls.CONFIG_FILE.stat()
+        _config_cache = ((st.st_mtime_ns, st.st_size), config, None)
+    
+    @classmethod
+    def load_config_json(cls) -> bytes:
+        """Get {"config": ...} as JSON bytes, serialized once per config version"""
+        global _config_cache
+        config = cls.load_config()
+        if _config_cache is None:
+            return _json_dumps({"config": config})
+        
+        if _config_cache[2] is None:
+            _config_cache = (_config_cache[0], _config_cache[1], _json_dumps({"config": _config_cache[1]}))
+        return _config_cache[2]
 
 
 # =============================================================================
 # Platform Utilities
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
+def _find_opencode_path() -> Optional[str]:
+    """Find OpenCode executable on the system (cached for the process lifetime)"""
+    
+    # Check environment variable
+    env_path = os.environ.get('OPENCODE_PATH')
+    if env_path and os.path.exists(env_path):
+        return env_path
+    
+    # Platform-specific search locations
+    if sys.platform == 'win32':
+        # Windows
+        search_paths = [
+            Path(os.environ.get('LOCALAPPDATA', '')) / 'Programs' / 'opencode' / 'opencode.exe',
+            Path(os.environ.get('PROGRAMFILES', '')) / 'opencode' / 'opencode.exe',
+            Path.home() / 'AppData' / 'Local' / 'Programs' / 'opencode' / 'opencode.exe',
+        ]
+    else:
+        # Linux/Mac
+        search_paths = [
+            Path('/usr/local/bin/opencode'),
+            Path('/usr/bin/opencode'),
+            Path.home() / '.local' / 'bin' / 'opencode',
+            Path.home() / 'bin' / 'opencode',
+        ]
+    
+    for path in search_paths:
+        if path.exists():
+            return str(path)
+    
+    # Check PATH
+    opencode_cmd = shutil.which('opencode')
+    if opencode_cmd:
+        return opencode_cmd
+    
+    return None
+
+
+# Shared HTTP client for all traffic to the OpenCode server (created lazily)
+_OPENCODE_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_opencode_client() -> httpx.AsyncClient:
+    """Get the pooled client used to talk to the OpenCode server"""
+    global _OPENCODE_CLIENT
+    if _OPENCODE_CLIENT is None:
+        # Each open SSE stream holds a connection, so keep the pool roomy
+        _OPENCODE_CLIENT = httpx.AsyncClient(
+            base_url=Config.OPENCODE_BASE_URL,
+            timeout=Config.API_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=128,
+                max_keepalive_connections=64,
+                keepalive_expiry=30.0
+            )
+        )
+    return _OPENCODE_CLIENT
+
+
+async def _close_opencode_client():
+    """Close the pooled OpenCode client, if it was ever created"""
+    global _OPENCODE_CLIENT
+    if _OPENCODE_CLIENT is not None:
+        await _OPENCODE_CLIENT.aclose()
+        _OPENCODE_CLIENT = None
+
+
 class PlatformUtils:
     """Cross-platform utilities for OpenCode server management"""
     
     @staticmethod
     def find_opencode_path() -> Optional[str]:
         """Find OpenCode executable on the system"""
-        
-        # Check environment variable
-        env_path = os.environ.get('OPENCODE_PATH')
-        if env_path and os.path.exists(env_path):
-            return env_path
-        
-        # Platform-specific search locations
-        if sys.platform == 'win32':
-            # Windows
-            search_paths = [
-                Path(os.environ.get('LOCALAPPDATA', '')) / 'Programs' / 'opencode' / 'opencode.exe',
-                Path(os.environ.get('PROGRAMFILES', '')) / 'opencode' / 'opencode.exe',
-                Path.home() / 'AppData' / 'Local' / 'Programs' / 'opencode' / 'opencode.exe',
-            ]
-        else:
-            # Linux/Mac
-            search_paths = [
-                Path('/usr/local/bin/opencode'),
-                Path('/usr/bin/opencode'),
-                Path.home() / '.local' / 'bin' / 'opencode',
-                Path.home() / 'bin' / 'opencode',
-            ]
-        
-        for path in search_paths:
-            if path.exists():
-                return str(path)
-        
-        # Check PATH
-        import shutil as sh
-        opencode_cmd = sh.which('opencode')
-        if opencode_cmd:
-            return opencode_cmd
-        
-        return None
+        return _find_opencode_path()
     
     @staticmethod
     def is_port_available(port: int) -> bool:
@@ -375,13 +521,21 @@ class PlatformUtils:
     
     @staticmethod
     async def is_opencode_server_running(port: int = 2380) -> bool:
-        """Check if OpenCode server is running"""
+        """Check if OpenCode server is running (something accepts on its port)"""
+        # A TCP connect answers liveness without an HTTP round-trip, and
+        # awaiting it keeps slow refusals (e.g. on Windows) off the event loop
         try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                response = await client.get(f"http://localhost:{port}/health")
-                return response.status_code == 200
-        except:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection('127.0.0.1', port), timeout=2.0
+            )
+        except (OSError, asyncio.TimeoutError):
             return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
     
     @staticmethod
     def start_opencode_server(directory: str, port: int = 2380) -> bool:
@@ -427,27 +581,45 @@ class PlatformUtils:
 # Project Manager
 # =============================================================================
 
+# Last project listing, keyed on (projects dir, its st_mtime_ns)
+_projects_cache: Optional[tuple] = None
+
+
 class ProjectManager:
     """Manage projects (create, delete, list)"""
     
     @staticmethod
     def get_all_projects() -> List[Dict]:
         """Get list of all projects"""
+        global _projects_cache
+        
+        projects_dir = str(Config.PROJECTS_DIR)
+        try:
+            dir_mtime = os.stat(projects_dir).st_mtime_ns
+        except OSError:
+            return []
+        
+        # Adding or removing a project changes the directory's mtime
+        cache_key = (projects_dir, dir_mtime)
+        if _projects_cache is not None and _projects_cache[0] == cache_key:
+            return list(_projects_cache[1])
+        
         projects = []
-
-        if Config.PROJECTS_DIR.exists():
-            for item in Config.PROJECTS_DIR.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
+        with os.scandir(projects_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and not entry.name.startswith('.'):
+                    st = entry.stat()
                     projects.append({
-                        'name': item.name,
-                        'path': str(item),
-                        'created': item.stat().st_ctime,
-                        'modified': item.stat().st_mtime
+                        'name': entry.name,
+                        'path': entry.path,
+                        'created': st.st_ctime,
+                        'modified': st.st_mtime
                     })
         
         # Sort by creation time (newest first)
         projects.sort(key=lambda x: x['created'], reverse=True)
-        return projects
+        _projects_cache = (cache_key, projects)
+        return list(projects)
     
     @staticmethod
     def create_project(name: str, path: Optional[str] = None) -> Dict:
@@ -522,58 +694,84 @@ class WhisperService:
         self.device = "unknown"
         self.model_name = Config.WHISPER_MODEL
         self.compute_type = "unknown"
-        
-        if self.enabled:
-            self._load_model()
+        self._load_lock = threading.Lock()
     
     def _load_model(self):
-        """Load Whisper model"""
-        try:
-            # Detect device
-            device = Config.WHISPER_DEVICE
-            if device == "auto":
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-            
-            self.device = device
-            self.compute_type = "float16" if device == "cuda" else "int8"
+        """Load Whisper model (blocking - run in a worker thread)"""
+        with self._load_lock:
+            if self.model is not None or not self.enabled:
+                return
             
-            print(f"Loading Whisper model: {Config.WHISPER_MODEL} on {device}")
-            
-            self.model = WhisperModel(
-                Config.WHISPER_MODEL,
-                device=device,
-                compute_type=self.compute_type
-            )
-            
-            print("Whisper model loaded successfully")
-        except Exception as e:
-            print(f"Error loading Whisper model: {e}")
-            self.enabled = False
+            try:
+                import torch
+                from faster_whisper import WhisperModel
+                
+                # Detect device
+                device = Config.WHISPER_DEVICE
+                if device == "auto":
+                    device = "cuda" if torch.cuda.is_available() else "cpu"
+                
+                self.device = device
+                
+                # INT8 weights halve memory traffic; on CUDA keep FP16 activations
+                compute_type = Config.WHISPER_COMPUTE_TYPE
+                if compute_type == "auto":
+                    compute_type = "int8_float16" if device == "cuda" else "int8"
+                self.compute_type = compute_type
+                
+                print(f"Loading Whisper model: {Config.WHISPER_MODEL} on {device} ({compute_type})")
+                
+                model_kwargs = {"num_workers": 2}
+                if device == "cpu":
+                    model_kwargs["cpu_threads"] = max(1, (os.cpu_count() or 2) // 2)
+                
+                self.model = WhisperModel(
+                    Config.WHISPER_MODEL,
+                    device=device,
+                    compute_type=compute_type,
+                    **model_kwargs
+                )
+                
+                print("Whisper model loaded successfully")
+            except Exception as e:
+                print(f"Error loading Whisper model: {e}")
+                self.enabled = False
+    
+    async def ensure_loaded(self) -> bool:
+        """Load the model on first use; returns True if it is ready"""
+        if self.enabled and self.model is None:
+            await asyncio.to_thread(self._load_model)
+        return self.model is not None
     
     def get_status(self) -> Dict:
         """Get Whisper service status"""
+        loaded = self.model is not None
         return {
             "enabled": self.enabled,
+            "loaded": loaded,
             "model": self.model_name,
-            "device": self.device.upper() if self.enabled else "N/A",
-            "compute_type": self.compute_type if self.enabled else "N/A"
+            "device": self.device.upper() if self.enabled and loaded else "N/A",
+            "compute_type": self.compute_type if self.enabled and loaded else "N/A"
         }
     
     async def transcribe_file(self, file_path: str) -> Optional[str]:
         """Transcribe an audio file"""
-        if not self.enabled or not self.model:
+        if not await self.ensure_loaded():
             return None
         
-        try:
-            # Transcribe
+        def _run() -> str:
             segments, info = self.model.transcribe(
                 file_path,
                 language=Config.WHISPER_LANGUAGE,
-                beam_size=5
+                beam_size=5,
+                vad_filter=True
             )
-            
-            # Extract text
-            text = " ".join([segment.text for segment in segments])
+            # Segments are generated lazily, so decoding happens here too
+            return " ".join([segment.text for segment in segments])
+        
+        try:
+            # Transcribe in a worker thread to keep the event loop free
+            text = await asyncio.to_thread(_run)
             return text.strip()
             
         except Exception as e:
@@ -606,6 +804,9 @@ async def lifespan(app: FastAPI):
     Config.ensure_directories()
     print(f"[OK] Directories initialized")
     
+    # Open the shared OpenCode connection pool
+    _get_opencode_client()
+    
     # Check for OpenCode
     opencode_path = PlatformUtils.find_opencode_path()
     if opencode_path:
@@ -645,7 +846,7 @@ async def lifespan(app: FastAPI):
     
     # Check Whisper
     if whisper_service.enabled:
-        print(f"[OK] Whisper voice transcription enabled")
+        print(f"[OK] Whisper voice transcription enabled (model loads on first use)")
     else:
         print(f"[!] Whisper voice transcription disabled")
     
@@ -667,13 +868,15 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("\nShutting down Web Builder...")
+    await _close_opencode_client()
 
 # Initialize FastAPI app with lifespan
 app = FastAPI(
     title="OpenCode Web Builder",
     description="Web interface for OpenCode AI",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=_JSONResponse
 )
 
 # Add CORS middleware
@@ -687,7 +890,7 @@ app.add_middleware(
 
 
 # =============================================================================
-# Middleware - No Cache Headers
+# Middleware - No Cache Headers (development only)
 # =============================================================================
 
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -703,7 +906,9 @@ class NoCacheMiddleware(BaseHTTPMiddleware):
             response.headers["Expires"] = "0"
         return response
 
-app.add_middleware(NoCacheMiddleware)
+# Outside development, static files are revalidated via ETag instead
+if Config.DEV_MODE:
+    app.add_middleware(NoCacheMiddleware)
 
 
 # =============================================================================
@@ -784,6 +989,12 @@ async def restart_server(directory: str = ""):
     else:
         raise HTTPException(status_code=500, detail="Failed to start OpenCode server")
 
+@app.post("/api/server/rescan")
+async def rescan_opencode_path():
+    """Forget the cached OpenCode location and search for it again"""
+    _find_opencode_path.cache_clear()
+    return {"opencode_path": PlatformUtils.find_opencode_path()}
+
 
 # =============================================================================
 # API Routes - Project Management
@@ -792,14 +1003,14 @@ async def restart_server(directory: str = ""):
 @app.get("/api/projects")
 async def list_projects():
     """List all projects"""
-    projects = ProjectManager.get_all_projects()
+    projects = await asyncio.to_thread(ProjectManager.get_all_projects)
     return {"projects": projects}
 
 @app.post("/api/projects")
 async def create_project(name: str = Form(...), path: Optional[str] = Form(None)):
     """Create a new project"""
     try:
-        project = ProjectManager.create_project(name, path)
+        project = await asyncio.to_thread(ProjectManager.create_project, name, path)
         return {"success": True, "project": project}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -809,7 +1020,7 @@ async def create_project(name: str = Form(...), path: Optional[str] = Form(None)
 @app.delete("/api/projects/{name}")
 async def delete_project(name: str):
     """Delete a project"""
-    success = ProjectManager.delete_project(name)
+    success = await asyncio.to_thread(ProjectManager.delete_project, name)
     
     if success:
         return {"success": True, "message": f"Project '{name}' deleted"}
@@ -852,6 +1063,54 @@ async def select_project(name: str = Form(...)):
 # API Routes - SSE Event Streaming (MUST be before proxy route!)
 # =============================================================================
 
+# Prefix of SSE data lines
+_SSE_DATA_PREFIX = b'data: '
+
+
+async def coalesce_sse_frames(frames, max_bytes: int = Config.SSE_BATCH_MAX_BYTES):
+    """
+    Re-chunk an async stream of SSE frames for a slow consumer.
+    
+    Frames are read from upstream in a background task. Whenever the client
+    is ready for more data, every frame queued since the last write is sent
+    as a single chunk (up to max_bytes), instead of one write per frame.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=Config.SSE_QUEUE_MAX_FRAMES)
+    end = object()
+    
+    async def produce():
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(end)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            batch = []
+            size = 0
+            while isinstance(item, bytes):
+                batch.append(item)
+                size += len(item)
+                if size >= max_bytes or queue.empty():
+                    item = None
+                    break
+                item = queue.get_nowait()
+            
+            if batch:
+                yield b"".join(batch)
+            if item is end:
+                return
+            if isinstance(item, Exception):
+                raise item
+    finally:
+        producer.cancel()
+
+
 @app.get("/api/opencode/event")
 async def stream_events(directory: str = "", enhance: bool = True):
     """
@@ -879,74 +1138,93 @@ async def stream_events(directory: str = "", enhance: bool = True):
         
         print(f"[SSE] Connecting to: {target_url}?directory={directory}")
         
-        # Use httpx with streaming - no timeout for SSE
-        async with httpx.AsyncClient() as client:
-            try:
-                # Start streaming request
-                async with client.stream(
-                    'GET', 
-                    target_url, 
-                    params=params,
-                    timeout=httpx.Timeout(connect=10.0, read=None, write=None, pool=None)
-                ) as response:
-                    print(f"[SSE] Connected! Status: {response.status_code}")
-                    
-                    if response.status_code != 200:
-                        print(f"[SSE] Bad status: {response.status_code}")
-                        error_event = {"type": "connection.error", "properties": {"error": f"Status {response.status_code}"}}
-                        yield f"data: {json.dumps(error_event)}\n\n"
-                        return
-                    
-                    # Buffer for accumulating partial data
-                    buffer = ""
+        # Use the shared client with streaming - no timeout for SSE
+        client = _get_opencode_client()
+        try:
+            # Start streaming request
+            async with client.stream(
+                'GET', 
+                '/event', 
+                params=params,
+                timeout=httpx.Timeout(connect=10.0, read=None, write=None, pool=None)
+            ) as response:
+                print(f"[SSE] Connected! Status: {response.status_code}")
+                
+                if response.status_code != 200:
+                    print(f"[SSE] Bad status: {response.status_code}")
+                    error_event = {"type": "connection.error", "properties": {"error": f"Status {response.status_code}"}}
+                    yield b"data: " + _json_dumps(error_event) + b"\n\n"
+                    return
+                
+                # Per-event logging is decided once per connection
+                log_events = logger.isEnabledFor(logging.DEBUG)
+                
+                # Buffer for accumulating partial data. Frames stay as bytes;
+                # only the JSON payload of an enhanced event is ever parsed.
+                buffer = bytearray()
+                
+                async for chunk in response.aiter_bytes():
+                    # The leftover bytes hold no separator, but one may
+                    # straddle the old tail and the new chunk
+                    search_from = max(len(buffer) - 1, 0)
+                    buffer.extend(chunk)
                     
-                    # Iterate over raw bytes and decode
-                    async for chunk in response.aiter_bytes():
-                        buffer += chunk.decode('utf-8', errors='ignore')
+                    # SSE events are separated by double newlines.
+                    # Walk every complete event, then drop the consumed
+                    # prefix with a single del per chunk.
+                    start = 0
+                    while True:
+                        end = buffer.find(b'\n\n', search_from)
+                        if end < 0:
+                            break
+                        event_bytes = bytes(buffer[start:end])
+                        start = search_from = end + 2
                         
-                        # SSE events are separated by double newlines
-                        # Process complete events from buffer
-                        while '\n\n' in buffer:
-                            event_str, buffer = buffer.split('\n\n', 1)
-                            if event_str.strip():
-                                # Parse and enhance the event if requested
-                                if enhance and event_str.startswith('data: '):
-                                    try:
-                                        # Extract JSON data
-                                        json_str = event_str[6:]  # Remove 'data: ' prefix
-                                        event_data = json.loads(json_str)
-                                        
-                                        # Enhance with subagent metadata
-                                        enhanced_data = enhance_sse_event(event_data)
-                                        
-                                        # Log subagent events
-                                        if enhanced_data.get('_is_subagent'):
-                                            subagent_type = enhanced_data.get('_subagent_type', 'unknown')
-                                            print(f"[SSE] 📦 Subagent event: {subagent_type}")
-                                        
-                                        # Yield enhanced event
-                                        yield f"data: {json.dumps(enhanced_data)}\n\n"
-                                    except json.JSONDecodeError:
-                                        # Forward as-is if not valid JSON
-                                        print(f"[SSE] >> {event_str[:60]}...")
-                                        yield f"{event_str}\n\n"
-                                else:
-                                    # Forward event without enhancement
-                                    print(f"[SSE] >> {event_str[:60]}...")
-                                    yield f"{event_str}\n\n"
+                        if not event_bytes.strip():
+                            continue
+                        
+                        # Parse and enhance the event if requested
+                        if (enhance and event_bytes.startswith(_SSE_DATA_PREFIX)
+                                and sse_frame_needs_enhancing(event_bytes)):
+                            try:
+                                # Extract JSON data (zero-copy view past the prefix)
+                                event_data = _json_loads(memoryview(event_bytes)[len(_SSE_DATA_PREFIX):])
                                 
-            except asyncio.CancelledError:
-                print("[SSE] Connection cancelled")
-                raise
-            except Exception as e:
-                print(f"[SSE] Error: {type(e).__name__}: {e}")
-                import traceback
-                traceback.print_exc()
-                error_event = {"type": "connection.error", "properties": {"error": str(e)}}
-                yield f"data: {json.dumps(error_event)}\n\n"
-    
+                                # Enhance with subagent metadata
+                                enhanced_data = enhance_sse_event(event_data)
+                                
+                                # Log subagent events
+                                if log_events and enhanced_data.get('_is_subagent'):
+                                    logger.debug("[SSE] Subagent event: %s", enhanced_data.get('_subagent_type', 'unknown'))
+                                
+                                # Yield enhanced event
+                                yield _SSE_DATA_PREFIX + _json_dumps(enhanced_data) + b"\n\n"
+                            except ValueError:
+                                # Forward as-is if not valid JSON (or not UTF-8)
+                                if log_events:
+                                    logger.debug("[SSE] >> %s...", event_bytes[:60])
+                                yield event_bytes + b"\n\n"
+                        else:
+                            # Forward event without enhancement
+                            if log_events:
+                                logger.debug("[SSE] >> %s...", event_bytes[:60])
+                            yield event_bytes + b"\n\n"
+                    
+                    if start:
+                        del buffer[:start]
+                        
+        except asyncio.CancelledError:
+            print("[SSE] Connection cancelled")
+            raise
+        except Exception as e:
+            print(f"[SSE] Error: {type(e).__name__}: {e}")
+            # Full traceback only when debugging; upstream restarts make this common
+            logger.debug("[SSE] Error details", exc_info=True)
+            error_event = {"type": "connection.error", "properties": {"error": str(e)}}
+            yield b"data: " + _json_dumps(error_event) + b"\n\n"
+
     return StreamingResponse(
-        event_generator(),
+        coalesce_sse_frames(event_generator()),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -960,6 +1238,9 @@ async def stream_events(directory: str = "", enhance: bool = True):
 # API Routes - OpenCode Proxy
 # =============================================================================
 
+# Request headers not forwarded upstream (httpx sets its own)
+_EXCLUDED_REQUEST_HEADERS = frozenset({'host', 'content-length'})
+
 @app.api_route("/api/opencode/{path:path}", methods=["GET", "POST", "DELETE", "PATCH", "PUT"])
 async def proxy_opencode(request: Request, path: str):
     """
@@ -967,9 +1248,6 @@ async def proxy_opencode(request: Request, path: str):
     Forwards all requests to http://localhost:2380/{path}
     """
     
-    # Build target URL
-    target_url = f"{Config.OPENCODE_BASE_URL}/{path}"
-    
     # Get query parameters
     params = dict(request.query_params)
     
@@ -985,65 +1263,72 @@ async def proxy_opencode(request: Request, path: str):
     except:
         body = None
     
-    # Get headers (exclude host, content-length)
-    headers = {
-        k: v for k, v in request.headers.items()
-        if k.lower() not in ('host', 'content-length')
-    }
+    # Get headers (exclude host, content-length). Built straight from the
+    # raw, already lower-cased header list - no per-header decoding or lower()
+    headers = httpx.Headers(request.headers.raw)
+    for name in _EXCLUDED_REQUEST_HEADERS:
+        headers.pop(name, None)
     
     # Make request to OpenCode
-    async with httpx.AsyncClient(timeout=Config.API_TIMEOUT) as client:
-        try:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                params=params,
-                content=body,
-                headers=headers
+    client = _get_opencode_client()
+    try:
+        upstream_request = client.build_request(
+            method=request.method,
+            url=f"/{path}",
+            params=params,
+            content=body,
+            headers=headers
+        )
+        response = await client.send(upstream_request, stream=True)
+        
+        # Return response
+        content_type = response.headers.get('content-type', '')
+        if content_type.startswith('application/json'):
+            # Already JSON - stream the upstream bytes through without
+            # buffering or re-encoding; the connection is released afterwards
+            return StreamingResponse(
+                response.aiter_bytes(),
+                status_code=response.status_code,
+                media_type=content_type,
+                background=BackgroundTask(response.aclose)
             )
-            
-            # Filter out hop-by-hop headers that shouldn't be forwarded
-            excluded_headers = {
-                'content-length', 'content-encoding', 'transfer-encoding',
-                'connection', 'keep-alive', 'proxy-authenticate',
-                'proxy-authorization', 'te', 'trailers', 'upgrade'
-            }
-            response_headers = {
-                k: v for k, v in response.headers.items()
-                if k.lower() not in excluded_headers
-            }
-            
-            # Return response
-            content_type = response.headers.get('content-type', '')
-            if content_type.startswith('application/json'):
-                try:
-                    return JSONResponse(
-                        content=response.json(),
-                        status_code=response.status_code
-                    )
-                except:
-                    return JSONResponse(
-                        content={"raw": response.text},
-                        status_code=response.status_code
-                    )
-            else:
-                return JSONResponse(
-                    content={"raw": response.text},
-                    status_code=response.status_code
-                )
-            
-        except httpx.TimeoutException:
-            raise HTTPException(status_code=504, detail="OpenCode server timeout")
-        except httpx.ConnectError:
-            raise HTTPException(status_code=503, detail="OpenCode server not available")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Proxy error: {e}")
+        else:
+            # Wrapped as JSON for the frontend, so the body is needed in full
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            return _JSONResponse(
+                content={"raw": response.text},
+                status_code=response.status_code
+            )
+        
+    except httpx.TimeoutException:
+        raise HTTPException(status_code=504, detail="OpenCode server timeout")
+    except httpx.ConnectError:
+        raise HTTPException(status_code=503, detail="OpenCode server not available")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Proxy error: {e}")
 
 
 # =============================================================================
 # API Routes - Voice Transcription
 # =============================================================================
 
+def _save_upload_to_temp(src, suffix: str) -> str:
+    """Copy an upload's file object to a new temp file (blocking) and return its path"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        try:
+            # Copy in 64KB chunks rather than reading the whole upload into memory
+            shutil.copyfileobj(src, temp_file, 1 << 16)
+        except BaseException:
+            # The caller never gets the path, so don't leave a partial file behind
+            temp_file.close()
+            os.unlink(temp_file.name)
+            raise
+        return temp_file.name
+
+
 @app.post("/api/voice/transcribe")
 async def transcribe_audio(file: UploadFile = File(...)):
     """Transcribe uploaded audio file"""
@@ -1051,20 +1336,14 @@ async def transcribe_audio(file: UploadFile = File(...)):
     if not whisper_service.enabled:
         raise HTTPException(status_code=503, detail="Voice transcription not available")
     
-    # Save uploaded file to temp location
-    temp_file = None
+    # Save uploaded file to temp location (file I/O runs off the event loop)
+    temp_path = None
     try:
-        # Create temp file
         suffix = Path(file.filename).suffix if file.filename else ".webm"
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-        
-        # Write uploaded content
-        content = await file.read()
-        temp_file.write(content)
-        temp_file.close()
+        temp_path = await asyncio.to_thread(_save_upload_to_temp, file.file, suffix)
         
         # Transcribe
-        text = await whisper_service.transcribe_file(temp_file.name)
+        text = await whisper_service.transcribe_file(temp_path)
         
         if text:
             return {"success": True, "text": text}
@@ -1076,13 +1355,23 @@ async def transcribe_audio(file: UploadFile = File(...)):
     
     finally:
         # Clean up temp file
-        if temp_file:
+        if temp_path:
             try:
-                os.unlink(temp_file.name)
+                await asyncio.to_thread(os.unlink, temp_path)
             except:
                 pass
 
 
+@app.post("/api/whisper/preload")
+async def preload_whisper():
+    """Load the Whisper model now instead of on the first transcription"""
+    if not whisper_service.enabled:
+        raise HTTPException(status_code=503, detail="Voice transcription not available")
+    
+    await whisper_service.ensure_loaded()
+    return {"success": whisper_service.model is not None, "whisper": whisper_service.get_status()}
+
+
 # =============================================================================
 # API Routes - File System Operations
 # =============================================================================
@@ -1100,13 +1389,14 @@ async def open_folder(path: str = Form(...)):
             # If it's a file, open its parent directory
             folder_path = folder_path.parent
         
-        # Platform-specific folder opening
+        # Platform-specific folder opening (spawning a process blocks, so
+        # it runs in a worker thread)
         if sys.platform == 'win32':
-            os.startfile(str(folder_path))
+            await asyncio.to_thread(os.startfile, str(folder_path))
         elif sys.platform == 'darwin':  # macOS
-            subprocess.Popen(['open', str(folder_path)])
+            await asyncio.to_thread(subprocess.Popen, ['open', str(folder_path)])
         else:  # Linux
-            subprocess.Popen(['xdg-open', str(folder_path)])
+            await asyncio.to_thread(subprocess.Popen, ['xdg-open', str(folder_path)])
         
         return {"success": True, "path": str(folder_path)}
         
@@ -1120,7 +1410,7 @@ async def get_projects_root():
     config = Config.load_config()
     return {
         "path": str(Config.PROJECTS_DIR),
-        "default": str(Path.home() / "Desktop" / "game")
+        "default": str(Config.DEFAULT_PROJECTS_DIR)
     }
 
 
@@ -1154,8 +1444,7 @@ async def set_projects_root(path: str = Form(...)):
 @app.get("/api/config")
 async def get_config():
     """Get application configuration"""
-    config = Config.load_config()
-    return {"config": config}
+    return Response(content=Config.load_config_json(), media_type="application/json")
 
 @app.post("/api/config")
 async def update_config(config_data: Dict[str, Any]):
@@ -1170,11 +1459,24 @@ async def update_config(config_data: Dict[str, Any]):
 # Static Files (CSS, JS, Images)
 # =============================================================================
 
+class RevalidatingStaticFiles(StaticFiles):
+    """
+    Static files that browsers may cache but must revalidate.
+    
+    StaticFiles already sends ETag/Last-Modified and answers conditional
+    requests with 304, so unchanged assets cost a header round-trip only.
+    """
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
 # Mount static files directory
 if Config.STATIC_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(Config.STATIC_DIR)), name="static")
-    app.mount("/css", StaticFiles(directory=str(Config.STATIC_DIR / "css")), name="css")
-    app.mount("/js", StaticFiles(directory=str(Config.STATIC_DIR / "js")), name="js")
+    app.mount("/static", RevalidatingStaticFiles(directory=str(Config.STATIC_DIR)), name="static")
+    app.mount("/css", RevalidatingStaticFiles(directory=str(Config.STATIC_DIR / "css")), name="css")
+    app.mount("/js", RevalidatingStaticFiles(directory=str(Config.STATIC_DIR / "js")), name="js")
 
 
 # Note: Startup and shutdown events are now handled by the lifespan context manager above
@@ -1187,12 +1489,27 @@ if Config.STATIC_DIR.exists():
 def main():
     """Main entry point"""
     
+    # Show per-event SSE diagnostics in development
+    if Config.DEV_MODE:
+        logging.basicConfig(format="%(message)s")
+        logger.setLevel(logging.DEBUG)
+    
+    # Prefer the libuv event loop and C HTTP parser (both ship with
+    # uvicorn[standard]); uvloop is POSIX-only
+    loop = "asyncio"
+    if sys.platform != 'win32' and importlib.util.find_spec("uvloop") is not None:
+        loop = "uvloop"
+    http = "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+    
     # Run server
     uvicorn.run(
         app,
         host=Config.WEB_HOST,
         port=Config.WEB_PORT,
-        log_level="info"
+        log_level="warning",
+        access_log=False,
+        loop=loop,
+        http=http
     )
 
 